@@ -1,8 +1,17 @@
-from .segy_reader import SegyLine, SegyLineMeta, load_multiple_lines, load_segy_line
+from .segy_reader import (
+    LazySampleView,
+    SegyLine,
+    SegyLineMeta,
+    available_trace_fields,
+    load_multiple_lines,
+    load_segy_line,
+)
 
 __all__ = [
+    "LazySampleView",
     "SegyLine",
     "SegyLineMeta",
     "load_segy_line",
     "load_multiple_lines",
+    "available_trace_fields",
 ]
@@ -1,7 +1,12 @@
 from __future__ import annotations
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
 
 import numpy as np
 
@@ -12,6 +17,16 @@ except ImportError as exc:  # pragma: no cover - segyio required at runtime
         "segyio is required to read SEG-Y files. Install it via `pip install segyio`."
     ) from exc
 
+try:
+    import segfast
+except ImportError:  # pragma: no cover - optional memmap engine
+    segfast = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional JIT acceleration
+    numba = None
+
 @dataclass
 class SegyLineMeta:
     """Summary information about a SEG-Y 2D line."""
@@ -26,14 +41,92 @@ class SegyLineMeta:
     x_field: Optional[str] = None
     y_field: Optional[str] = None
     cdp_field: Optional[str] = None
+    amp_scale: float = 1.0
+    amp_dtype: str = "float32"
+    # Amplitude statistics gathered while loading (None for lazy or
+    # geometry-only loads). p5/p95 are Gaussian estimates, mean -/+ 1.645 std.
+    amp_min: Optional[float] = None
+    amp_max: Optional[float] = None
+    amp_mean: Optional[float] = None
+    amp_std: Optional[float] = None
+    amp_p5: Optional[float] = None
+    amp_p95: Optional[float] = None
+
+
+class LazySampleView:
+    """Read-on-demand stand-in for the ``(n_traces, n_samples)`` sample matrix.
+
+    Indexing reads only the requested traces through segyio's ``trace.raw``
+    and returns them as float32, whatever the file's sample format.  The file
+    is opened (and memory-mapped) on first access and stays open until
+    :meth:`close` or until the view is garbage collected.
+    ``np.asarray`` materialises the whole matrix.
+    """
+
+    dtype = np.dtype(np.float32)
+    ndim = 2
+
+    def __init__(self, path: str | Path, n_traces: int, n_samples: int):
+        self.path = str(path)
+        self.shape = (n_traces, n_samples)
+        self._file: Optional["segyio.SegyFile"] = None
+        self._closer: Optional[weakref.finalize] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self.shape[0] * self.shape[1]
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, key):
+        traces, rest = (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+        if not isinstance(traces, (slice, int, np.integer)):
+            raise TypeError("LazySampleView supports integer or slice trace indices")
+        if isinstance(traces, np.integer):
+            traces = int(traces)
+        with self._lock:
+            block = self._handle().trace.raw[traces]
+        # Integer-format files come back as int16/int32; match ``dtype`` and
+        # eager loads. Float formats are already float32 and pass through.
+        block = block.astype(np.float32, copy=False)
+        if not rest:
+            return block
+        if isinstance(traces, slice):
+            return block[(slice(None),) + rest]
+        return block[rest]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[:]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._closer()
+                self._file = None
+
+    def _handle(self) -> "segyio.SegyFile":
+        if self._file is None:
+            fh = segyio.open(self.path, "r", strict=False)
+            fh.mmap()
+            self._file = fh
+            # Release the handle and its mapping once the view goes away.
+            self._closer = weakref.finalize(self, fh.close)
+        return self._file
 
 
 @dataclass
 class SegyLine:
-    """Container holding the seismic samples and their spatial metadata."""
+    """Container holding the seismic samples and their spatial metadata.
+
+    ``samples`` is a :class:`LazySampleView` rather than an ndarray when the
+    line was loaded with ``lazy=True``.
+    """
 
     meta: SegyLineMeta
-    samples: np.ndarray  # (n_traces, n_samples)
+    samples: np.ndarray  # (n_traces, n_samples); (n_traces, 0) for geometry-only loads
     times_ms: np.ndarray  # (n_samples,)
     distance: np.ndarray  # (n_traces,)
     x: np.ndarray  # (n_traces,)
@@ -41,7 +134,49 @@ class SegyLine:
     cdp: np.ndarray  # (n_traces,)
 
     def amplitude_range(self) -> tuple[float, float]:
-        return float(np.nanmin(self.samples)), float(np.nanmax(self.samples))
+        if self.samples.size == 0:
+            return 0.0, 0.0
+        if self.meta.amp_min is not None:
+            return self.meta.amp_min, self.meta.amp_max
+        # Reduce in trace chunks so lazy views never materialise the full line.
+        lo, hi = np.inf, -np.inf
+        jit = self.samples.size >= _NUMBA_MIN_SAMPLES
+        for start in range(0, self.samples.shape[0], _AMPLITUDE_CHUNK_TRACES):
+            block = self.samples[start:start + _AMPLITUDE_CHUNK_TRACES]
+            block_lo, block_hi = _nan_min_max(block, jit)
+            lo = min(lo, block_lo)
+            hi = max(hi, block_hi)
+        if lo > hi:  # every sample is NaN
+            return float("nan"), float("nan")
+        scale = self.meta.amp_scale
+        return lo * scale, hi * scale
+
+    def dequantize(self) -> np.ndarray:
+        """Return the samples as float32 amplitudes, undoing any quantization."""
+
+        samples = np.asarray(self.samples)
+        if samples.dtype == np.float32 and self.meta.amp_scale == 1.0:
+            return samples
+        return samples.astype(np.float32) * np.float32(self.meta.amp_scale)
+
+    @cached_property
+    def _finite_xy(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return _compact_finite(self.x, self.y)
+
+    @property
+    def x_finite(self) -> np.ndarray:
+        """float32 x of the traces whose x and y are both finite (for display)."""
+        return self._finite_xy[0]
+
+    @property
+    def y_finite(self) -> np.ndarray:
+        """float32 y matching :attr:`x_finite`."""
+        return self._finite_xy[1]
+
+    @property
+    def bbox_xy(self) -> np.ndarray:
+        """``(xmin, xmax, ymin, ymax)`` of the finite coordinates; NaN if none."""
+        return self._finite_xy[2]
 
     def line_length(self) -> float:
         return float(self.distance[-1]) if len(self.distance) else 0.0
@@ -52,6 +187,23 @@ DEFAULT_Y_FIELD = segyio.TraceField.SourceY
 DEFAULT_CDP_FIELD = segyio.TraceField.CDP
 SCALAR_FIELD = segyio.TraceField.SourceGroupScalar
 
+# Raw on-disk sample dtypes for the numpy engine. IBM floats are kept as raw
+# words and decoded by segyio.tools.native.
+_MEMMAP_SAMPLE_DTYPES = {
+    int(segyio.SegySampleFormat.IBM_FLOAT_4_BYTE): np.dtype(np.uint32),
+    int(segyio.SegySampleFormat.SIGNED_INTEGER_4_BYTE): np.dtype(">i4"),
+    int(segyio.SegySampleFormat.SIGNED_SHORT_2_BYTE): np.dtype(">i2"),
+    int(segyio.SegySampleFormat.IEEE_FLOAT_4_BYTE): np.dtype(">f4"),
+    int(segyio.SegySampleFormat.SIGNED_CHAR_1_BYTE): np.dtype(np.int8),
+}
+
+_AMPLITUDE_CHUNK_TRACES = 4096
+_READ_CHUNK_TRACES = 1024
+# Below this many traces the NumPy path wins over the JIT kernel's overhead.
+_NUMBA_MIN_TRACES = 1_000_000
+# Likewise for whole-line sample reductions.
+_NUMBA_MIN_SAMPLES = 100_000_000
+
 
 def load_segy_line(
     path: str | Path,
@@ -60,32 +212,67 @@ def load_segy_line(
     x_field: int = DEFAULT_X_FIELD,
     y_field: int = DEFAULT_Y_FIELD,
     cdp_field: Optional[int] = DEFAULT_CDP_FIELD,
+    engine: str = "segyio",
+    quantize: bool = False,
+    load_geometry_only: bool = False,
+    lazy: bool = False,
+    progress_cb: Optional[Callable[[int, int], None]] = None,
 ) -> SegyLine:
-    """Load a single SEG-Y line and return trace samples with metadata."""
+    """Load a single SEG-Y line and return trace samples with metadata.
 
-    path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(path)
+    ``engine`` selects the reader backend: ``"segyio"`` (default),
+    ``"memmap"``, which maps the file with segfast and decodes traces and
+    headers as vectorised NumPy operations, or ``"numpy"``, which views the
+    file through :class:`numpy.memmap` directly (big-endian files with
+    fixed-length traces only).
 
-    with segyio.open(path.as_posix(), "r", strict=False) as f:
-        f.mmap()
+    With ``quantize=True`` the samples are stored as int16 scaled to the peak
+    absolute amplitude (``meta.amp_scale`` converts back to amplitude units),
+    halving the memory footprint of large lines.
 
-        samples = _read_samples(f)
-        n_traces, n_samples = samples.shape
+    With ``load_geometry_only=True`` the trace samples are not read at all:
+    ``samples`` is an empty ``(n_traces, 0)`` array while times, coordinates
+    and distances are filled in as usual.
 
-        dt_us = _read_sample_interval_us(f)
-        times_ms = np.arange(n_samples, dtype=np.float32) * (dt_us / 1000.0)
+    With ``lazy=True`` the samples stay on disk: ``samples`` is a
+    :class:`LazySampleView` that reads only the traces being indexed.
 
-        scalars = _read_scalars(f)
-        x = _read_and_scale_attribute(f, x_field, scalars)
-        y = _read_and_scale_attribute(f, y_field, scalars)
-        cdp = (
-            _read_attribute(f, cdp_field)
-            if cdp_field is not None
-            else np.arange(n_traces, dtype=np.float32)
+    Samples are read in chunks of traces; ``progress_cb(done, total)`` is
+    called after each chunk when given.
+    """
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
+
+    if engine == "segyio":
+        reader = _read_with_segyio
+    elif engine == "memmap":
+        reader = _read_with_segfast
+    elif engine == "numpy":
+        reader = _read_with_numpy_memmap
+    else:
+        raise ValueError(
+            f"Unknown SEG-Y engine {engine!r}; use 'segyio', 'memmap' or 'numpy'."
         )
+    if lazy and quantize:
+        raise ValueError("quantize cannot be combined with lazy loading")
 
-        distance = _compute_cumulative_distance(x, y)
+    samples, n_samples, dt_us, x, y, cdp = reader(
+        path, x_field, y_field, cdp_field, not (load_geometry_only or lazy), progress_cb
+    )
+    if lazy and not load_geometry_only:
+        samples = LazySampleView(path, samples.shape[0], n_samples)
+    else:
+        # Convert once here so views can take zero-copy float32 transposes.
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+    stats = {} if lazy else _amplitude_stats(samples)
+    amp_scale = 1.0
+    if quantize and samples.size:
+        samples, amp_scale = _quantize_samples(samples)
+    n_traces = samples.shape[0]
+    times_ms = _times_ms(n_samples, dt_us)
+    distance = _compute_cumulative_distance(x, y)
 
     meta = SegyLineMeta(
         name=name or path.stem,
@@ -96,6 +283,9 @@ def load_segy_line(
         x_field=_trace_field_name(x_field),
         y_field=_trace_field_name(y_field),
         cdp_field=_trace_field_name(cdp_field) if cdp_field is not None else None,
+        amp_scale=amp_scale,
+        amp_dtype=samples.dtype.name,
+        **stats,
     )
 
     return SegyLine(
@@ -109,12 +299,184 @@ def load_segy_line(
     )
 
 
-def load_multiple_lines(paths: Iterable[str | Path]) -> Dict[str, SegyLine]:
-    """Load many SEG-Y files, ensuring unique names based on file stems."""
+def _read_with_segyio(
+    path: Path,
+    x_field: int,
+    y_field: int,
+    cdp_field: Optional[int],
+    load_samples: bool,
+    progress_cb: Optional[Callable[[int, int], None]],
+) -> tuple[np.ndarray, int, float, np.ndarray, np.ndarray, np.ndarray]:
+    with segyio.open(path.as_posix(), "r", strict=False) as f:
+        f.mmap()
+
+        n_samples = len(f.samples)
+        if load_samples:
+            samples = _read_samples(f, progress_cb)
+        else:
+            samples = np.empty((f.tracecount, 0), dtype=np.float32)
+        dt_us = _read_sample_interval_us(f)
+
+        scalars = _read_scalars(f)
+        x = _read_and_scale_attribute(f, x_field, scalars)
+        y = _read_and_scale_attribute(f, y_field, scalars)
+        cdp = (
+            _read_attribute(f, cdp_field)
+            if cdp_field is not None
+            else np.arange(f.tracecount, dtype=np.float32)
+        )
+    return samples, n_samples, dt_us, x, y, cdp
+
+
+def _read_with_segfast(
+    path: Path,
+    x_field: int,
+    y_field: int,
+    cdp_field: Optional[int],
+    load_samples: bool,
+    progress_cb: Optional[Callable[[int, int], None]],
+) -> tuple[np.ndarray, int, float, np.ndarray, np.ndarray, np.ndarray]:
+    if segfast is None:
+        raise ImportError(
+            "The 'memmap' engine requires segfast. Install it via `pip install segfast`."
+        )
+
+    sf = segfast.open(path.as_posix(), engine="memmap")
+    n_traces = sf.n_traces
+    n_samples = sf.n_samples
+
+    samples = np.empty((n_traces, n_samples if load_samples else 0), dtype=np.float32)
+    if load_samples:
+        for start in range(0, n_traces, _READ_CHUNK_TRACES):
+            stop = min(start + _READ_CHUNK_TRACES, n_traces)
+            sf.load_traces(np.arange(start, stop), buffer=samples[start:stop])
+            if progress_cb is not None:
+                progress_cb(stop, n_traces)
+    dt_us = _read_sample_interval_us(sf.file_handler)
+
+    fields = [x_field, y_field, SCALAR_FIELD]
+    if cdp_field is not None:
+        fields.append(cdp_field)
+    names = [_trace_field_name(field) for field in fields]
+    headers = sf.load_headers(list(dict.fromkeys(names)))
+
+    scalars = headers[_trace_field_name(SCALAR_FIELD)].to_numpy(dtype=np.int32)
+    x = _scale_coordinates(headers[names[0]].to_numpy(), scalars)
+    y = _scale_coordinates(headers[names[1]].to_numpy(), scalars)
+    cdp = (
+        headers[names[3]].to_numpy()
+        if cdp_field is not None
+        else np.arange(n_traces, dtype=np.float32)
+    )
+    return samples, n_samples, dt_us, x, y, cdp
+
+
+def _read_with_numpy_memmap(
+    path: Path,
+    x_field: int,
+    y_field: int,
+    cdp_field: Optional[int],
+    load_samples: bool,
+    progress_cb: Optional[Callable[[int, int], None]],
+) -> tuple[np.ndarray, int, float, np.ndarray, np.ndarray, np.ndarray]:
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    if raw.size < 3600:
+        raise ValueError(f"{path.name} is too small to be a SEG-Y file")
+
+    n_samples = _binary_header_value(raw, segyio.BinField.Samples)
+    dt_us = float(_binary_header_value(raw, segyio.BinField.Interval))
+    sample_format = _binary_header_value(raw, segyio.BinField.Format)
+    n_extended = max(_binary_header_value(raw, segyio.BinField.ExtendedHeaders), 0)
+    try:
+        sample_dtype = _MEMMAP_SAMPLE_DTYPES[sample_format]
+    except KeyError:
+        raise ValueError(
+            f"Sample format {sample_format} is not supported by the numpy engine; "
+            "use engine='segyio'."
+        ) from None
+
+    trace_dtype = np.dtype(
+        [("header", np.uint8, (240,)), ("samples", sample_dtype, (n_samples,))]
+    )
+    data_offset = 3600 + 3200 * n_extended
+    n_traces, remainder = divmod(raw.size - data_offset, trace_dtype.itemsize)
+    if remainder:
+        raise ValueError(
+            f"{path.name} does not have fixed-length traces; use engine='segyio'."
+        )
+    traces = raw[data_offset:].view(trace_dtype)
+    headers = traces["header"]
+    if not dt_us and n_traces:
+        interval_field = segyio.TraceField.TRACE_SAMPLE_INTERVAL
+        dt_us = float(_trace_header_column(headers[:1], interval_field)[0])
+
+    samples = np.empty((n_traces, n_samples if load_samples else 0), dtype=np.float32)
+    if load_samples:
+        for start in range(0, n_traces, _READ_CHUNK_TRACES):
+            stop = min(start + _READ_CHUNK_TRACES, n_traces)
+            block = traces["samples"][start:stop]
+            if sample_format == segyio.SegySampleFormat.IBM_FLOAT_4_BYTE:
+                block = segyio.tools.native(block, format=sample_format)
+            samples[start:stop] = block
+            if progress_cb is not None:
+                progress_cb(stop, n_traces)
+
+    scalars = _trace_header_column(headers, SCALAR_FIELD)
+    x = _scale_coordinates(_trace_header_column(headers, x_field), scalars)
+    y = _scale_coordinates(_trace_header_column(headers, y_field), scalars)
+    cdp = (
+        _trace_header_column(headers, cdp_field)
+        if cdp_field is not None
+        else np.arange(n_traces, dtype=np.float32)
+    )
+    return samples, n_samples, dt_us, x, y, cdp
+
+
+def _binary_header_value(raw: np.ndarray, field: int) -> int:
+    # Binary header fields used here are all big-endian int16.
+    start = field - 1
+    return int(raw[start:start + 2].view(">i2")[0])
+
+
+def _trace_header_column(headers: np.ndarray, field: int) -> np.ndarray:
+    """Decode one big-endian trace header field from ``(n_traces, 240)`` bytes."""
+
+    size = _trace_field_size(field)
+    start = field - 1
+    column = np.ascontiguousarray(headers[:, start:start + size])
+    return column.view(">i4" if size == 4 else ">i2")[:, 0].astype(np.int32)
+
+
+@lru_cache(maxsize=None)
+def _trace_field_size(field: int) -> int:
+    later = [position for position in _tracefield_mapping() if position > field]
+    return (min(later) if later else 241) - field
+
+
+def load_multiple_lines(
+    paths: Iterable[str | Path],
+    *,
+    max_workers: Optional[int] = None,
+    **kwargs: Any,
+) -> Dict[str, SegyLine]:
+    """Load many SEG-Y files, ensuring unique names based on file stems.
+
+    Files are read concurrently on a thread pool (segyio and NumPy release the
+    GIL while decoding); ``max_workers`` defaults to ``min(8, len(paths))``.
+    Remaining keyword arguments are forwarded to :func:`load_segy_line`.
+    """
+
+    paths = list(paths)
+    if not paths:
+        return {}
+    if max_workers is None:
+        max_workers = min(8, len(paths))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda p: load_segy_line(p, **kwargs), paths))
 
     lines: Dict[str, SegyLine] = {}
-    for raw_path in paths:
-        line = load_segy_line(raw_path)
+    for line in results:
         base_name = line.meta.name
         final_name = base_name
         counter = 1
@@ -126,9 +488,98 @@ def load_multiple_lines(paths: Iterable[str | Path]) -> Dict[str, SegyLine]:
     return lines
 
 
-def _read_samples(fh: "segyio.SegyFile") -> np.ndarray:
-    data = np.stack([trace[:] for trace in fh.trace[:]], axis=0)
-    return data.astype(np.float32, copy=False)
+def _read_samples(
+    fh: "segyio.SegyFile",
+    progress_cb: Optional[Callable[[int, int], None]] = None,
+) -> np.ndarray:
+    n_traces = fh.tracecount
+    n_samples = len(fh.samples)
+    out = np.empty((n_traces, n_samples), dtype=np.float32)
+
+    # ``trace.raw`` reads a whole chunk of traces with a single C call; the
+    # chunks are copied into one preallocated buffer to bound peak memory.
+    raw = fh.trace.raw
+    for start in range(0, n_traces, _READ_CHUNK_TRACES):
+        stop = min(start + _READ_CHUNK_TRACES, n_traces)
+        out[start:stop] = raw[start:stop]
+        if progress_cb is not None:
+            progress_cb(stop, n_traces)
+    return out
+
+
+@lru_cache(maxsize=32)
+def _times_ms(n_samples: int, dt_us: float) -> np.ndarray:
+    """Return the shared, read-only sample time axis in milliseconds.
+
+    Lines with the same acquisition geometry share one array; call ``.copy()``
+    before modifying it.
+    """
+
+    times = np.arange(n_samples, dtype=np.float32) * (dt_us / 1000.0)
+    times.setflags(write=False)
+    return times
+
+
+def _amplitude_stats(samples: np.ndarray) -> Dict[str, float]:
+    """Return min/max/mean/std and 5/95% estimates as ``SegyLineMeta`` fields.
+
+    One pass over trace chunks; per-chunk mean and squared deviations are
+    merged with Chan et al.'s pairwise update, so large lines neither lose
+    precision nor overflow a running sum of squares.  NaN and inf samples are
+    ignored.
+    """
+
+    count, mean, m2 = 0, 0.0, 0.0
+    lo, hi = np.inf, -np.inf
+    for start in range(0, samples.shape[0], _AMPLITUDE_CHUNK_TRACES):
+        block = samples[start:start + _AMPLITUDE_CHUNK_TRACES].ravel()
+        finite = np.isfinite(block)
+        if not finite.all():
+            block = block[finite]
+        n = block.size
+        if n == 0:
+            continue
+        block_mean = float(block.mean(dtype=np.float64))
+        deviation = block - np.float32(block_mean)
+        block_m2 = float(np.dot(deviation, deviation))
+        lo = min(lo, float(block.min()))
+        hi = max(hi, float(block.max()))
+        total = count + n
+        delta = block_mean - mean
+        mean += delta * n / total
+        m2 += block_m2 + delta * delta * count * n / total
+        count = total
+    if count == 0:
+        return {}
+    std = float(np.sqrt(m2 / count))
+    return {
+        "amp_min": lo,
+        "amp_max": hi,
+        "amp_mean": mean,
+        "amp_std": std,
+        "amp_p5": max(lo, mean - 1.645 * std),
+        "amp_p95": min(hi, mean + 1.645 * std),
+    }
+
+
+def _quantize_samples(samples: np.ndarray) -> tuple[np.ndarray, float]:
+    """Quantize float samples to int16, returning the array and its scale.
+
+    Works in place on ``samples``, which must be a freshly read buffer.  NaNs
+    are stored as zero and infinities as the int16 extremes, so a stray
+    non-finite sample cannot flatten the scale of the rest of the line.
+    """
+
+    # Peak over finite samples only.
+    magnitude = np.abs(samples)
+    np.nan_to_num(magnitude, copy=False, nan=0.0, posinf=0.0)
+    peak = float(magnitude.max()) if samples.size else 0.0
+    scale = peak / 32767.0 if peak > 0.0 else 1.0
+    samples *= np.float32(1.0 / scale)
+    np.nan_to_num(samples, copy=False, nan=0.0, posinf=32767.0, neginf=-32767.0)
+    np.rint(samples, out=samples)
+    np.clip(samples, -32767, 32767, out=samples)
+    return samples.astype(np.int16), scale
 
 
 def _read_sample_interval_us(fh: "segyio.SegyFile") -> float:
@@ -147,44 +598,178 @@ def _read_scalars(fh: "segyio.SegyFile") -> np.ndarray:
 
 
 def _read_attribute(fh: "segyio.SegyFile", field: int) -> np.ndarray:
-    attr = np.array(fh.attributes(field)[:], dtype=np.float64)
-    return attr
+    # Keep segyio's native header dtype (int32); callers promote as needed.
+    return fh.attributes(field)[:]
 
 
 def _read_and_scale_attribute(
     fh: "segyio.SegyFile", field: int, scalars: np.ndarray
 ) -> np.ndarray:
     values = _read_attribute(fh, field)
-    scaled = np.empty_like(values, dtype=np.float64)
-    for idx, (value, scalar) in enumerate(zip(values, scalars, strict=True)):
-        if scalar == 0:
-            scaled[idx] = value
-        elif scalar > 0:
-            scaled[idx] = value / scalar
-        else:
-            scaled[idx] = value * abs(scalar)
-    return scaled.astype(np.float64)
+    return _scale_coordinates(values, scalars)
+
+
+def _scale_coordinates(values: np.ndarray, scalars: np.ndarray) -> np.ndarray:
+    # SEG-Y coordinate scalar: 0 = unscaled, >0 = divisor, <0 = multiplier.
+    if numba is not None and values.size >= _NUMBA_MIN_TRACES:
+        out = np.empty(values.shape, dtype=np.float64)
+        _scale_kernel(np.ascontiguousarray(values), np.ascontiguousarray(scalars), out)
+        return out
+    # Build the factor and the result in place on freshly cast buffers.
+    factor = scalars.astype(np.float64)
+    positive = factor > 0
+    np.negative(factor, out=factor, where=factor < 0)
+    factor[factor == 0] = 1.0
+    np.divide(1.0, factor, out=factor, where=positive)
+
+    scaled = values.astype(np.float64)
+    np.multiply(scaled, factor, out=scaled)
+    return scaled
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _scale_kernel(values, scalars, out):  # pragma: no cover - compiled
+        for i in numba.prange(values.size):
+            scalar = scalars[i]
+            if scalar == 0:
+                out[i] = values[i]
+            elif scalar > 0:
+                out[i] = values[i] / scalar
+            else:
+                out[i] = values[i] * -scalar
+
+
+def _nan_min_max(block: np.ndarray, jit: bool = False) -> tuple[float, float]:
+    """Return ``(nanmin, nanmax)`` of a 2D block, or ``(inf, -inf)`` if all NaN.
+
+    ``jit`` selects the numba kernel when it is available; callers decide
+    per line, since reductions run block by block.
+    """
+
+    if jit and numba is not None:
+        lo, hi = _min_max_kernel(block)
+        return float(lo), float(hi)
+    lo = float(np.fmin.reduce(block, axis=None))
+    hi = float(np.fmax.reduce(block, axis=None))
+    if np.isnan(lo):
+        return np.inf, -np.inf
+    return lo, hi
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _min_max_kernel(block):  # pragma: no cover - compiled
+        # One pass over the block; NaNs fail both comparisons and are skipped.
+        n_rows = block.shape[0]
+        row_min = np.full(n_rows, np.inf)
+        row_max = np.full(n_rows, -np.inf)
+        for i in numba.prange(n_rows):
+            lo = np.inf
+            hi = -np.inf
+            for j in range(block.shape[1]):
+                value = block[i, j]
+                if value < lo:
+                    lo = value
+                if value > hi:
+                    hi = value
+            row_min[i] = lo
+            row_max[i] = hi
+        return row_min.min(), row_max.max()
+
+
+def _compact_finite(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Drop points with a non-finite coordinate; return float32 ``(x, y, bbox)``."""
+
+    # float32 is ample for plotting and halves every later scan.
+    if numba is not None and x.size >= _NUMBA_MIN_TRACES:
+        x, y, bbox = _compact_finite_kernel(x, y)
+        if not x.size:
+            bbox[:] = np.nan
+        return x, y, bbox
+    mask = np.isfinite(x)
+    np.logical_and(mask, np.isfinite(y), out=mask)
+    x = x[mask].astype(np.float32, copy=False)
+    y = y[mask].astype(np.float32, copy=False)
+    if not x.size:
+        return x, y, np.full(4, np.nan, dtype=np.float32)
+    return x, y, np.array([x.min(), x.max(), y.min(), y.max()], dtype=np.float32)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _compact_finite_kernel(x, y):  # pragma: no cover - compiled
+        # Filter, narrow to float32 and track the bounding box in one pass.
+        out_x = np.empty(x.size, dtype=np.float32)
+        out_y = np.empty(x.size, dtype=np.float32)
+        bbox = np.array([np.inf, -np.inf, np.inf, -np.inf], dtype=np.float32)
+        k = 0
+        for i in range(x.size):
+            xi = np.float32(x[i])
+            yi = np.float32(y[i])
+            if not (np.isfinite(xi) and np.isfinite(yi)):
+                continue
+            out_x[k] = xi
+            out_y[k] = yi
+            k += 1
+            bbox[0] = min(bbox[0], xi)
+            bbox[1] = max(bbox[1], xi)
+            bbox[2] = min(bbox[2], yi)
+            bbox[3] = max(bbox[3], yi)
+        return out_x[:k], out_y[:k], bbox
 
 
 def _compute_cumulative_distance(x: np.ndarray, y: np.ndarray) -> np.ndarray:
     if x.size == 0:
         return np.array([], dtype=np.float64)
-    coords = np.column_stack((x, y))
-    diffs = np.diff(coords, axis=0)
-    segment_lengths = np.linalg.norm(diffs, axis=1)
-    distance = np.concatenate(([0.0], np.cumsum(segment_lengths)))
-    return distance.astype(np.float64)
+    dx = np.diff(x).astype(np.float64, copy=False)
+    dy = np.diff(y).astype(np.float64, copy=False)
+    seg = np.hypot(dx, dy, out=dx)
+    distance = np.empty(x.size, dtype=np.float64)
+    distance[0] = 0.0
+    np.cumsum(seg, out=distance[1:])
+    return distance
 
 
 def _trace_field_name(field: Optional[int]) -> Optional[str]:
     if field is None:
         return None
-    return segyio.tracefield_keys.get(field, str(field))
+    return _tracefield_mapping().get(field, str(field))
+
+
+@lru_cache(maxsize=1)
+def available_trace_fields() -> Mapping[str, int]:
+    """Return the segyio trace header fields as ``{name: byte position}``.
+
+    The mapping is sorted by name, built once per process and read-only.
+    """
+
+    fields = sorted((name, field) for field, name in _tracefield_mapping().items())
+    return MappingProxyType(dict(fields))
+
+
+@lru_cache(maxsize=1)
+def _tracefield_mapping() -> Mapping[int, str]:
+    """Map trace header byte positions to their segyio field names."""
+
+    mapping: Dict[int, str] = {}
+    for attr in dir(segyio.TraceField):
+        if attr.startswith("_"):
+            continue
+        value = getattr(segyio.TraceField, attr)
+        if isinstance(value, int):
+            mapping.setdefault(int(value), attr)
+    return MappingProxyType(mapping)
 
 
 __all__ = [
+    "LazySampleView",
     "SegyLineMeta",
     "SegyLine",
     "load_segy_line",
     "load_multiple_lines",
+    "available_trace_fields",
 ]
@@ -4,6 +4,13 @@ from typing import Dict, Any
 import json
 import os
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON backend
+    orjson = None
+
 @dataclass
 class Project:
     name: str = "Untitled"
@@ -12,15 +19,44 @@ class Project:
 
     def save(self, path: str):
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self), f, indent=2)
+        data = asdict(self)
+        # Encode before opening the file so a failed encode cannot truncate
+        # an existing project.
+        if orjson is not None:
+            # orjson encodes in C and serialises numpy arrays natively. It
+            # writes non-finite floats as null where json writes NaN, and
+            # non-str keys are stringified as json.dump would.
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            raw = orjson.dumps(data, option=options)
+        else:
+            raw = json.dumps(data, indent=2, default=_numpy_default).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(raw)
 
     @staticmethod
     def load(path: str) -> "Project":
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(path, 'rb') as f:
+            raw = f.read()
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                # Projects saved without orjson may contain NaN/Infinity,
+                # which only the stdlib parser accepts.
+                data = json.loads(raw)
+        else:
+            data = json.loads(raw)
         p = Project()
         p.name = data.get('name', p.name)
         p.version = data.get('version', p.version)
         p.lines = data.get('lines', {})
         return p
+
+
+def _numpy_default(obj: Any) -> Any:
+    # Accept the numpy values orjson's OPT_SERIALIZE_NUMPY handles.
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
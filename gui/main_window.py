@@ -1,11 +1,53 @@
 from __future__ import annotations
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict
+from typing import Collection, Dict, List, Optional, Tuple
 
 from PyQt6 import QtWidgets, QtCore
 
 from backend.io.segy_reader import SegyLine, load_segy_line
-from .views import CrossSectionView, MapView, ThreeDView
+from . import views
+from .views import MapView
+
+# Tabs whose view is only built the first time the tab is shown:
+# attribute name on MainWindow -> (view class name in gui.views, tab label)
+_LAZY_VIEWS = {
+    "cross_section_view": ("CrossSectionView", "Cross-section"),
+    "view3d": ("ThreeDView", "3D"),
+}
+
+
+class _LoadSignals(QtCore.QObject):
+    finished = QtCore.pyqtSignal(str, object)  # path, SegyLine
+    failed = QtCore.pyqtSignal(str, str)  # path, error message
+
+
+class _LoadTask(QtCore.QRunnable):
+    """Load one SEG-Y file on a pool thread and report back via signals."""
+
+    def __init__(self, path: str, signals: _LoadSignals):
+        super().__init__()
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        try:
+            line = load_segy_line(self.path)
+        except Exception as exc:  # pragma: no cover - GUI feedback
+            self.signals.failed.emit(self.path, str(exc))
+        else:
+            self.signals.finished.emit(self.path, line)
+
+
+@dataclass
+class _ImportBatch:
+    total: int
+    signals: _LoadSignals
+    progress: QtWidgets.QProgressDialog
+    names: Dict[str, str]  # path -> line name, reserved in selection order
+    done: int = 0
+    loaded: List[str] = field(default_factory=list)
+    errors: List[Tuple[str, str]] = field(default_factory=list)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -15,16 +57,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1200, 800)
 
         self.lines: Dict[str, SegyLine] = {}
+        self._import: Optional[_ImportBatch] = None
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(100)
+        self._refresh_timer.timeout.connect(self._refresh_views)
 
         # Central widgets
         self.tabs = QtWidgets.QTabWidget()
         self.map_view = MapView()
-        self.cross_section_view = CrossSectionView()
-        self.view3d = ThreeDView()
+        self.cross_section_view = None
+        self.view3d = None
 
         self.tabs.addTab(self.map_view, "Map 2D")
-        self.tabs.addTab(self.cross_section_view, "Cross-section")
-        self.tabs.addTab(self.view3d, "3D")
+        self._lazy_pages: Dict[QtWidgets.QWidget, str] = {}
+        for attr, (_, label) in _LAZY_VIEWS.items():
+            page = QtWidgets.QWidget()
+            QtWidgets.QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._lazy_pages[page] = attr
+            self.tabs.addTab(page, label)
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         self.setCentralWidget(self.tabs)
 
@@ -58,47 +110,130 @@ class MainWindow(QtWidgets.QMainWindow):
             "SEG-Y Files (*.sgy *.segy *.SEG *.SGY)",
             "All Files (*)",
         ])
-        if not dialog.exec():
+        if self._import is not None or not dialog.exec():
             return
 
         paths = dialog.selectedFiles()
-        loaded = []
-        errors = []
+        if not paths:
+            return
+
+        signals = _LoadSignals(self)
+        signals.finished.connect(self._on_line_loaded)
+        signals.failed.connect(self._on_line_failed)
+        progress = QtWidgets.QProgressDialog(
+            "Importing SEG-Y lines…", "Cancel", 0, len(paths), self
+        )
+        progress.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.setAutoReset(False)
+        progress.canceled.connect(self._cancel_import)
+        # Name lines in selection order: loads finish in any order, so
+        # duplicate stems must not be numbered on arrival.
+        names: Dict[str, str] = {}
+        taken = set(self.lines)
         for path in paths:
-            try:
-                line = load_segy_line(path)
-                name = _unique_name(Path(path).stem, self.lines)
-                line.meta.name = name
-                self.lines[name] = line
-                loaded.append(name)
-            except Exception as exc:  # pragma: no cover - GUI feedback
-                errors.append((path, str(exc)))
-
-        if loaded:
-            self._refresh_views()
-            self.statusBar().showMessage(
-                f"Loaded {len(loaded)} line(s): {', '.join(loaded)}", 5000
-            )
+            names[path] = _unique_name(Path(path).stem, taken)
+            taken.add(names[path])
+        self._import = _ImportBatch(len(paths), signals, progress, names)
+
+        pool = QtCore.QThreadPool.globalInstance()
+        for path in paths:
+            pool.start(_LoadTask(path, signals))
 
-        if errors:
+    def _on_line_loaded(self, path: str, line: SegyLine):
+        if not self._is_current_import():
+            return
+        name = self._import.names[path]
+        line.meta.name = name
+        self.lines[name] = line
+        self._import.loaded.append(name)
+        self._schedule_refresh()
+        self._advance_import()
+
+    def _on_line_failed(self, path: str, error: str):
+        if not self._is_current_import():
+            return
+        self._import.errors.append((path, error))
+        self._advance_import()
+
+    def _is_current_import(self) -> bool:
+        # Results queued before a cancel can still arrive afterwards.
+        return self._import is not None and self.sender() is self._import.signals
+
+    def _advance_import(self):
+        batch = self._import
+        batch.done += 1
+        # A visible modal progress dialog processes events in setValue(), so
+        # further results or a Cancel click may finish the batch right here.
+        batch.progress.setValue(batch.done)
+        if self._import is batch and batch.done == batch.total:
+            self._finish_import()
+
+    def _cancel_import(self):
+        if self._import is None:
+            return
+        # Drop files that have not started yet and ignore results still in
+        # flight; whatever finished before the cancel is kept.
+        QtCore.QThreadPool.globalInstance().clear()
+        self._import.signals.blockSignals(True)
+        self._finish_import(cancelled=True)
+
+    def _finish_import(self, cancelled: bool = False):
+        batch, self._import = self._import, None
+        batch.progress.canceled.disconnect(self._cancel_import)
+        batch.progress.close()
+        batch.progress.deleteLater()
+        if not cancelled:
+            # Tasks still running after a cancel may emit; keep it alive then.
+            batch.signals.deleteLater()
+
+        if batch.loaded or cancelled:
+            status = f"Loaded {len(batch.loaded)} line(s): {', '.join(batch.loaded)}"
+            if cancelled:
+                status = f"Import cancelled – {status}"
+            self.statusBar().showMessage(status, 5000)
+
+        if batch.errors:
             msg = QtWidgets.QMessageBox(self)
             msg.setIcon(QtWidgets.QMessageBox.Icon.Warning)
             msg.setWindowTitle("SEG-Y import errors")
-            detail = "\n".join(f"{Path(path).name}: {err}" for path, err in errors)
-            msg.setText(f"{len(errors)} file(s) failed to import.")
+            detail = "\n".join(
+                f"{Path(path).name}: {err}" for path, err in batch.errors
+            )
+            msg.setText(f"{len(batch.errors)} file(s) failed to import.")
             msg.setDetailedText(detail)
             msg.exec()
 
+    def _schedule_refresh(self):
+        # Coalesce bursts of completed loads into a single repaint.
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _on_tab_changed(self, index: int):
+        attr = self._lazy_pages.pop(self.tabs.widget(index), None)
+        if attr is None:
+            return
+        page = self.tabs.widget(index)
+        view = getattr(views, _LAZY_VIEWS[attr][0])()
+        page.layout().addWidget(view)
+        setattr(self, attr, view)
+        view.set_lines(self.lines)
+
     def _refresh_views(self):
         self.map_view.set_lines(self.lines)
-        self.cross_section_view.set_lines(self.lines)
-        self.view3d.set_lines(self.lines)
+        if self.cross_section_view is not None:
+            self.cross_section_view.set_lines(self.lines)
+        if self.view3d is not None:
+            self.view3d.set_lines(self.lines)
 
 
-def _unique_name(base: str, existing: Dict[str, SegyLine]) -> str:
+def _unique_name(base: str, existing: Collection[str]) -> str:
     if base not in existing:
         return base
-    idx = 1
-    while f"{base}_{idx}" in existing:
-        idx += 1
-    return f"{base}_{idx}"
+    prefix = f"{base}_"
+    used = {
+        int(key[len(prefix):])
+        for key in existing
+        if key.startswith(prefix) and key[len(prefix):].isdecimal()
+    }
+    return f"{base}_{max(used, default=0) + 1}"
@@ -1,5 +1,25 @@
-from .map_view import MapView
-from .cross_section_view import CrossSectionView
-from .view3d import ThreeDView
+from importlib import import_module
 
 __all__ = ["MapView", "CrossSectionView", "ThreeDView"]
+
+# Views are imported on first access (PEP 562) so pyqtgraph and its OpenGL
+# module are only loaded when a tab actually needs them.
+_MODULES = {
+    "MapView": ".map_view",
+    "CrossSectionView": ".cross_section_view",
+    "ThreeDView": ".view3d",
+}
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,10 @@
 from __future__ import annotations
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, Optional
 
 import numpy as np
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 import pyqtgraph as pg
 
 from backend.io.segy_reader import SegyLine
@@ -15,6 +17,14 @@ class CrossSectionView(QtWidgets.QWidget):
         super().__init__(parent)
         self._lines: Dict[str, SegyLine] = {}
         self._current: Optional[str] = None
+        # line name -> combo row, kept in step with the combo's items
+        self._combo_index: Dict[str, int] = {}
+        # name -> (line, vmin, vmax) display levels; see _levels
+        self._level_cache: Dict[str, tuple[SegyLine, float, float]] = {}
+        # (line, window) of the image currently on screen; see _render_window
+        self._rendered: Optional[tuple[SegyLine, _Window]] = None
+        # LRU of colour-mapped images: (name,) + window -> (line, rgb)
+        self._rgb_cache: OrderedDict[tuple, tuple[SegyLine, np.ndarray]] = OrderedDict()
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(6, 6, 6, 6)
@@ -36,11 +46,22 @@ class CrossSectionView(QtWidgets.QWidget):
         self.plot_item.invertY(True)
         self.plot_item.setLabel("left", "Time", units="ms")
         self.plot_item.setLabel("bottom", "Distance", units="m")
-        self.image_item = pg.ImageItem()
-        self.image_item.setLookupTable(pg.colormap.get("CET-L4").getLookupTable())
+        # Display images are (time, distance): rows map to y, columns to x.
+        # Images are colour-mapped here (see _render_image), so no LUT is set.
+        self.image_item = pg.ImageItem(axisOrder="row-major")
         self.plot_item.addItem(self.image_item)
+        # Ranges are always set explicitly; never let setImage trigger autorange.
+        self.plot_item.vb.disableAutoRange()
+        self.plot_item.vb.sigRangeChanged.connect(self._on_view_changed)
         layout.addWidget(self.plot_widget, 1)
 
+        # Re-decimate once resizing, panning or zooming settles rather than on
+        # every event.
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(150)
+        self._render_timer.timeout.connect(self._on_view_settled)
+
         self._update_placeholder()
 
     # ------------------------------------------------------------------
@@ -48,18 +69,25 @@ class CrossSectionView(QtWidgets.QWidget):
     def set_lines(self, lines: Dict[str, SegyLine]):
         previous = self._current
         self._lines = lines
+        self._level_cache = {
+            name: entry
+            for name, entry in self._level_cache.items()
+            if lines.get(name) is entry[0]
+        }
+        for key in [key for key, entry in self._rgb_cache.items() if lines.get(key[0]) is not entry[0]]:
+            del self._rgb_cache[key]
         self.combo.blockSignals(True)
         self.combo.clear()
+        names = sorted(lines.keys())
+        self._combo_index = {name: index for index, name in enumerate(names)}
         if lines:
-            for name in sorted(lines.keys()):
-                self.combo.addItem(name)
+            self.combo.addItems(names)
             self.combo.blockSignals(False)
-            if previous and previous in lines:
-                index = self.combo.findText(previous)
-                if index != -1:
-                    self.combo.setCurrentIndex(index)
-                    self._on_line_changed(previous)
-                    return
+            index = self._combo_index.get(previous) if previous else None
+            if index is not None:
+                self.combo.setCurrentIndex(index)
+                self._on_line_changed(previous)
+                return
             self.combo.setCurrentIndex(0)
             self._on_line_changed(self.combo.currentText())
         else:
@@ -67,6 +95,10 @@ class CrossSectionView(QtWidgets.QWidget):
             self._current = None
             self._update_placeholder()
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._on_view_changed()
+
     # ------------------------------------------------------------------
     # Internal helpers
     def _on_line_changed(self, name: str):
@@ -86,19 +118,14 @@ class CrossSectionView(QtWidgets.QWidget):
             self._update_placeholder()
             return
 
-        # Rotate to (time, distance) order for display
-        image = np.asarray(data.T, dtype=np.float32)
-        hist_min, hist_max = _robust_min_max(image)
-
-        self.image_item.setImage(image, autoLevels=False, levels=(hist_min, hist_max))
-        self.image_item.resetTransform()
-
-        dx = _estimate_spacing(line.distance)
-        dy = (line.meta.dt_us or 1000.0) / 1000.0
-        x0 = line.distance[0] if line.distance.size else 0.0
-        y0 = line.times_ms[0] if line.times_ms.size else 0.0
-        self.image_item.translate(x0, y0)
-        self.image_item.scale(dx if dx > 0 else 1.0, dy if dy > 0 else 1.0)
+        # The view range is only applied at the next paint, so render the
+        # whole line now; _on_view_settled refines it for the new range.
+        n_traces, n_samples = data.shape
+        self._render_image(name, line, (
+            0, n_samples, _decimation_step(n_samples, self.plot_widget.height()),
+            0, n_traces, _decimation_step(n_traces, self.plot_widget.width()),
+        ))
+        x0, y0, dx, dy = _image_geometry(line)
 
         x_min = float(x0)
         x_max = float(line.distance[-1]) if line.distance.size else data.shape[0]
@@ -108,31 +135,221 @@ class CrossSectionView(QtWidgets.QWidget):
             x_max = x_min + max(dx, 1.0)
         if y_max <= y_min:
             y_max = y_min + max(dy, 1.0)
-        self.plot_item.setRange(xRange=(x_min, x_max), yRange=(y_min, y_max))
+        # Deferred to the next paint, so the view range settles only once.
+        self.plot_item.setRange(
+            xRange=(x_min, x_max), yRange=(y_min, y_max), padding=0, update=False
+        )
 
         self.info_label.setText(
             f"{line.meta.name}: {line.meta.n_traces} traces · {line.meta.n_samples} samples · dt={line.meta.dt_us/1000:.2f} ms"
         )
 
+    def _on_view_changed(self, *_):
+        if self._current is not None:
+            self._render_timer.start()
+
+    def _on_view_settled(self):
+        line = self._lines.get(self._current) if self._current else None
+        if line is None or not line.samples.size:
+            return
+        window = self._render_window(line)
+        if window is not None:
+            self._render_image(self._current, line, window)
+
+    def _render_window(self, line: SegyLine) -> Optional[_Window]:
+        """Return the sample window and steps to render for the visible range.
+
+        Steps are chosen so the visible part never carries more pixels than
+        the widget shows; zooming in therefore refines down to 1:1.  The
+        window extends a quarter view past each edge so short pans stay
+        covered, and starts on a step boundary so blocks do not shift.
+        """
+
+        x0, y0, dx, dy = _image_geometry(line)
+        (xa, xb), (ya, yb) = self.plot_item.vb.viewRange()
+        n_traces, n_samples = line.samples.shape
+        rows = _axis_window((ya - y0) / dy, (yb - y0) / dy, n_samples, self.plot_widget.height())
+        cols = _axis_window((xa - x0) / dx, (xb - x0) / dx, n_traces, self.plot_widget.width())
+        if rows is None or cols is None:
+            return None
+        return rows + cols
+
+    def _render_image(self, name: str, line: SegyLine, window: _Window):
+        # Compare the line by identity: SegyLine equality would compare arrays.
+        rendered = self._rendered
+        if rendered is not None and rendered[0] is line and rendered[1] == window:
+            return
+        r0, r1, sy, c0, c1, sx = window
+
+        key = (name,) + window
+        cached = self._rgb_cache.get(key)
+        if cached is not None and cached[0] is line:
+            self._rgb_cache.move_to_end(key)
+            rgb = cached[1]
+        else:
+            hist_min, hist_max = self._levels(name, line)
+            image = _decimated_window(line.samples, window)
+            rgb = _get_lut()[_to_uint8(image, hist_min, hist_max)]
+            self._rgb_cache[key] = (line, rgb)
+            if len(self._rgb_cache) > _RGB_CACHE_SIZE:
+                self._rgb_cache.popitem(last=False)
+
+        self.image_item.setImage(rgb, autoLevels=False)
+        x0, y0, dx, dy = _image_geometry(line)
+        self.image_item.setTransform(
+            QtGui.QTransform().translate(x0 + c0 * dx, y0 + r0 * dy).scale(dx * sx, dy * sy)
+        )
+        self._rendered = (line, window)
+
+    def _levels(self, name: str, line: SegyLine) -> tuple[float, float]:
+        cached = self._level_cache.get(name)
+        if cached is not None and cached[0] is line:
+            return cached[1], cached[2]
+        hist_min, hist_max = _line_levels(line) or _robust_min_max(line.samples)
+        self._level_cache[name] = (line, hist_min, hist_max)
+        return hist_min, hist_max
+
     def _update_placeholder(self):
+        self._rendered = None
         self.image_item.clear()
         self.image_item.resetTransform()
         self.plot_item.setLabel("bottom", "Distance", units="m")
         self.plot_item.setLabel("left", "Time", units="ms")
-        self.plot_item.setRange(xRange=(0, 1), yRange=(0, 1))
+        self.plot_item.setRange(xRange=(0, 1), yRange=(0, 1), padding=0, update=False)
         self.info_label.setText("Load a SEG-Y line to begin")
 
 
-def _robust_min_max(image: np.ndarray) -> tuple[float, float]:
-    finite = image[np.isfinite(image)]
-    if finite.size == 0:
+def _line_levels(line: SegyLine) -> Optional[tuple[float, float]]:
+    """Return display levels from the loader's statistics, in stored units."""
+
+    meta = line.meta
+    if meta.amp_p5 is None or not meta.amp_p95 > meta.amp_p5:
+        return None
+    return meta.amp_p5 / meta.amp_scale, meta.amp_p95 / meta.amp_scale
+
+
+# Colour-mapped images kept for quick switching between recently shown lines.
+_RGB_CACHE_SIZE = 8
+
+# Quantized and lazy lines are converted to float32 this many traces at a time.
+_DECIMATE_CHUNK_TRACES = 1024
+
+# Percentile levels are estimated from at most about this many samples.
+_LEVEL_SAMPLE_BUDGET = 1_000_000
+
+
+def _robust_min_max(samples: np.ndarray) -> tuple[float, float]:
+    step = 1
+    if samples.size > _LEVEL_SAMPLE_BUDGET:
+        # A regular 2D stride keeps the sample spread over traces and times.
+        # Striding traces before conversion means lazy and quantized lines
+        # only ever read or convert the subsample.
+        step = int(np.ceil(np.sqrt(samples.size / _LEVEL_SAMPLE_BUDGET)))
+    values = np.asarray(samples[::step], dtype=np.float32)[:, ::step].ravel()
+    finite = np.isfinite(values)
+    if not finite.all():
+        values = values[finite]
+    if values.size == 0:
         return 0.0, 1.0
-    vmin, vmax = np.percentile(finite, [5, 95])
+    # Linear-time selection of the 5th/95th percentile order statistics.
+    k_lo = int(0.05 * (values.size - 1))
+    k_hi = int(0.95 * (values.size - 1))
+    part = np.partition(values, (k_lo, k_hi))
+    vmin, vmax = part[k_lo], part[k_hi]
     if vmin == vmax:
         vmax = vmin + 1.0
     return float(vmin), float(vmax)
 
 
+@lru_cache(maxsize=1)
+def _get_lut() -> np.ndarray:
+    """Return the 256-entry CET-L4 RGB table, built once and shared by all views."""
+
+    lut = pg.colormap.get("CET-L4").getLookupTable(nPts=256)
+    lut.setflags(write=False)
+    return lut
+
+
+def _image_geometry(line: SegyLine) -> tuple[float, float, float, float]:
+    """Return ``(x0, y0, dx, dy)`` placing one image pixel per trace/sample."""
+
+    dx = _estimate_spacing(line.distance)
+    dy = (line.meta.dt_us or 1000.0) / 1000.0
+    x0 = line.distance[0] if line.distance.size else 0.0
+    y0 = line.times_ms[0] if line.times_ms.size else 0.0
+    return x0, y0, dx if dx > 0 else 1.0, dy if dy > 0 else 1.0
+
+
+# (first row, end row, row step, first column, end column, column step)
+_Window = tuple[int, int, int, int, int, int]
+
+
+def _axis_window(lo: float, hi: float, n: int, pixels: int) -> Optional[tuple[int, int, int]]:
+    """Return ``(start, stop, step)`` along one axis for a view of ``[lo, hi]``."""
+
+    start = max(int(np.floor(lo)), 0)
+    stop = min(int(np.ceil(hi)), n)
+    if stop <= start:
+        return None
+    step = _decimation_step(stop - start, pixels)
+    pad = (stop - start) // 4
+    start = max(start - pad, 0)
+    start -= start % step
+    return start, min(stop + pad, n), step
+
+
+def _decimation_step(n_pixels: int, target: int) -> int:
+    target = max(target, 1)
+    if n_pixels <= 2 * target:
+        return 1
+    return n_pixels // target
+
+
+def _decimated_window(samples: np.ndarray, window: _Window) -> np.ndarray:
+    """Return the float32 ``(time, distance)`` image of ``window`` of ``samples``."""
+
+    r0, r1, sy, c0, c1, sx = window
+    if isinstance(samples, np.ndarray) and samples.dtype == np.float32:
+        return _decimate(samples[c0:c1, r0:r1], sx, sy)
+    # Quantized or lazy samples: convert one block-aligned run of traces at a
+    # time so no full-resolution float32 copy of the window is ever held.
+    chunk = sx * max(1, _DECIMATE_CHUNK_TRACES // sx)
+    stop = c0 + (c1 - c0) // sx * sx
+    pieces = [
+        _decimate(np.asarray(samples[start:min(start + chunk, stop), r0:r1], dtype=np.float32), sx, sy)
+        for start in range(c0, stop, chunk)
+    ]
+    if not pieces:  # window narrower than one block
+        return _decimate(np.asarray(samples[c0:c1, r0:r1], dtype=np.float32), sx, sy)
+    return np.concatenate(pieces, axis=1)
+
+
+def _decimate(block: np.ndarray, st: int, ss: int) -> np.ndarray:
+    """Reduce a ``(traces, samples)`` block by ``(st, ss)``, keeping each block's
+    signed peak, and return it as a ``(time, distance)`` image."""
+
+    if st == 1 and ss == 1:
+        return block.T
+    cols = block.shape[0] // st
+    rows = block.shape[1] // ss
+    # Splitting both axes of a slice is a strided view, never a copy.
+    blocks = block[: cols * st, : rows * ss].reshape(cols, st, rows, ss)
+    hi = blocks.max(axis=(1, 3))
+    lo = blocks.min(axis=(1, 3))
+    # Seismic data is bipolar: keep whichever extreme has the larger magnitude.
+    return np.where(-lo > hi, lo, hi).T
+
+
+def _to_uint8(image: np.ndarray, vmin: float, vmax: float) -> np.ndarray:
+    """Map ``[vmin, vmax]`` onto the 256 lookup-table entries (NaN -> 0)."""
+
+    scaled = np.subtract(image, vmin, dtype=np.float32)
+    scaled *= np.float32(255.0 / (vmax - vmin))
+    np.clip(scaled, 0, 255, out=scaled)
+    np.nan_to_num(scaled, copy=False, nan=0.0)
+    return scaled.astype(np.uint8)
+
+
 def _estimate_spacing(distance: np.ndarray) -> float:
     if distance.size < 2:
         return 1.0
@@ -140,4 +357,8 @@ def _estimate_spacing(distance: np.ndarray) -> float:
     diffs = diffs[np.isfinite(diffs) & (diffs > 0)]
     if diffs.size == 0:
         return 1.0
-    return float(np.median(diffs))
+    # Regularly spaced lines are the common case; skip the selection for them.
+    mid = diffs.size // 2
+    if diffs[0] == diffs[mid] == diffs[-1]:
+        return float(diffs[0])
+    return float(np.partition(diffs, mid)[mid])
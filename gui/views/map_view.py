@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict
+from typing import Dict, List
 
 from PyQt6 import QtCore, QtWidgets
 import numpy as np
@@ -14,6 +14,12 @@ class MapView(QtWidgets.QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._lines: Dict[str, SegyLine] = {}
+        # set_lines ran while hidden; redraw on the next show
+        self._dirty = False
+        # (name, line) pairs in legend/colour order, refreshed by set_lines
+        self._sorted_items: List[tuple[str, SegyLine]] = []
+        # name -> (curve, line it shows, colour index); curves persist across updates
+        self._curves: Dict[str, tuple[pg.PlotDataItem, SegyLine, int]] = {}
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(6, 6, 6, 6)
 
@@ -35,40 +41,60 @@ class MapView(QtWidgets.QWidget):
 
     def set_lines(self, lines: Dict[str, SegyLine]):
         self._lines = lines
-        self._update_plot()
+        self._sorted_items = sorted(lines.items())
+        self._dirty = True
+        if self.isVisible():
+            self._update_plot()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._update_plot()
 
     def _update_plot(self):
-        self.plot_widget.clear()
-        self._legend = self._plot_item.legend
-        if self._legend is None:
-            self._legend = self._plot_item.addLegend(offset=(-10, 10))
-        else:
-            self._legend.clear()
+        self._dirty = False
+        # Colours follow the sorted position of every line, drawn or not.
+        curves = []
+        for idx, (name, line) in enumerate(self._sorted_items):
+            if line.x_finite.size:
+                curves.append((idx, name, line, line.x_finite, line.y_finite, line.bbox_xy))
 
-        if not self._lines:
+        drawn = {curve[1] for curve in curves}
+        for name in [name for name in self._curves if name not in drawn]:
+            self._plot_item.removeItem(self._curves.pop(name)[0])
+
+        if not curves:
+            self._legend.clear()
             self._no_data_label.show()
             return
 
         self._no_data_label.hide()
-        bounds = []
-        for idx, (name, line) in enumerate(sorted(self._lines.items())):
-            if line.x.size == 0:
-                continue
-            mask = np.isfinite(line.x) & np.isfinite(line.y)
-            if not np.any(mask):
-                continue
-            x = line.x[mask]
-            y = line.y[mask]
+        legend_stale = list(self._curves) != [curve[1] for curve in curves]
+        for idx, name, line, x, y, _ in curves:
             pen = pg.mkPen(color=pg.intColor(idx), width=2)
-            self.plot_widget.plot(x, y, pen=pen, name=name)
-            bounds.append((x.min(), x.max(), y.min(), y.max()))
-
-        if bounds:
-            xmin = min(b[0] for b in bounds)
-            xmax = max(b[1] for b in bounds)
-            ymin = min(b[2] for b in bounds)
-            ymax = max(b[3] for b in bounds)
-            self.plot_widget.setXRange(xmin, xmax, padding=0.1)
-            self.plot_widget.setYRange(ymin, ymax, padding=0.1)
-        else:
-            self._no_data_label.show()
+            previous = self._curves.get(name)
+            if previous is None:
+                # Coordinates are already finite; spare pyqtgraph its own check.
+                item = pg.PlotDataItem(x, y, pen=pen, skipFiniteCheck=True)
+                self._plot_item.addItem(item)
+            else:
+                item, old_line, old_idx = previous
+                if old_line is not line:
+                    item.setData(x, y, skipFiniteCheck=True)
+                if old_idx != idx:
+                    item.setPen(pen)
+            self._curves[name] = (item, line, idx)
+
+        if legend_stale:
+            # Rebuild the (small) legend in sorted order; curves are kept.
+            self._curves = {curve[1]: self._curves[curve[1]] for curve in curves}
+            self._legend.clear()
+            for name, (item, _, _) in self._curves.items():
+                self._legend.addItem(item, name)
+
+        boxes = np.stack([curve[5] for curve in curves])
+        xmin, ymin = boxes[:, [0, 2]].min(axis=0)
+        xmax, ymax = boxes[:, [1, 3]].max(axis=0)
+        # Python floats: float32 scalars overflow against ViewBox's limits.
+        self.plot_widget.setXRange(float(xmin), float(xmax), padding=0.1)
+        self.plot_widget.setYRange(float(ymin), float(ymax), padding=0.1)
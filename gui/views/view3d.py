@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterable, List
 
 import numpy as np
 from PyQt6 import QtCore, QtWidgets
@@ -10,18 +11,65 @@ import pyqtgraph.opengl as gl
 from backend.io.segy_reader import SegyLine
 
 
+class _CullingViewWidget(gl.GLViewWidget):
+    """GLViewWidget that hides registered items whose box is outside the view."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cull_items: List[gl.GLGraphicsItem.GLGraphicsItem] = []
+        self._cull_boxes = np.empty((0, 2, 3))
+
+    def set_cull_boxes(self, boxes: Dict[gl.GLGraphicsItem.GLGraphicsItem, np.ndarray]):
+        """Register ``item -> [[xmin, ymin, zmin], [xmax, ymax, zmax]]`` boxes."""
+
+        self._cull_items = list(boxes)
+        self._cull_boxes = np.array(list(boxes.values())).reshape(-1, 2, 3)
+
+    def paintGL(self):
+        if self._cull_items:
+            self._cull(self.getViewport())
+        super().paintGL()
+
+    def _cull(self, viewport):
+        matrix = self.projectionMatrix(viewport, viewport) * self.viewMatrix()
+        # QMatrix4x4.data() is column-major; rows give the clip planes
+        # (Gribb & Hartmann): w +/- x, w +/- y, w +/- z >= 0.
+        m = np.array(matrix.data(), dtype=np.float64).reshape(4, 4).T
+        planes = np.concatenate([m[3] + m[:3], m[3] - m[:3]])
+        normals, offsets = planes[:, :3], planes[:, 3]
+        lo, hi = self._cull_boxes[:, 0], self._cull_boxes[:, 1]
+        # A box is outside if its corner furthest along a plane normal is behind it.
+        corners = np.where(normals[None] >= 0, hi[:, None], lo[:, None])
+        visible = ((corners * normals[None]).sum(axis=2) + offsets >= 0).all(axis=1)
+        for item, show in zip(self._cull_items, visible):
+            if item.visible() != show:
+                item.setVisible(bool(show))
+
+
 class ThreeDView(QtWidgets.QWidget):
     """3D view stacking all loaded 2D lines in space."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._lines: Dict[str, SegyLine] = {}
-        self._surface_items: List[gl.GLSurfacePlotItem] = []
+        # set_lines ran while hidden; rebuild the scene on the next show
+        self._dirty = False
+        # line name -> curtain item, and the (line, amplitude bounds) it shows
+        self._surface_items: Dict[str, gl.GLMeshItem] = {}
+        self._surface_sources: Dict[str, tuple[SegyLine, float, float]] = {}
+        # id(line) -> (line, amplitude_range()); lines are immutable once loaded
+        self._amp_cache: Dict[int, tuple[SegyLine, tuple[float, float]]] = {}
+        # (id(samples), gmin, gmax) -> (samples, RGBA); holds the current and
+        # previous amplitude bounds so adding then removing a line is free
+        self._color_cache: Dict[tuple[int, float, float], tuple[np.ndarray, np.ndarray]] = {}
+        self._color_bounds: tuple[float, float] | None = None
+        # (256, 4) uint8 RGBA table; colouring is a gather into it
+        self._lut = pg.colormap.get("CET-L9").getLookupTable(0.0, 1.0, 256, alpha=True).astype(np.uint8)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(6, 6, 6, 6)
 
-        self.view = gl.GLViewWidget()
+        self.view = _CullingViewWidget()
         self.view.setBackgroundColor((10, 10, 10))
         self.view.opts["distance"] = 8000
         self.view.setCameraPosition(elevation=25, azimuth=35)
@@ -40,86 +88,205 @@ class ThreeDView(QtWidgets.QWidget):
 
     def set_lines(self, lines: Dict[str, SegyLine]):
         self._lines = lines
-        self._update_scene()
+        live = {id(line) for line in lines.values()}
+        self._amp_cache = {
+            key: entry for key, entry in self._amp_cache.items() if key in live
+        }
+        # Building curtains is the expensive part; wait until they can be seen.
+        self._dirty = True
+        if self.isVisible():
+            self._update_scene()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._update_scene()
 
     # ------------------------------------------------------------------
     def _update_scene(self):
-        for item in self._surface_items:
-            self.view.removeItem(item)
-        self._surface_items.clear()
+        self._dirty = False
+        for name in [name for name in self._surface_items if name not in self._lines]:
+            self._remove_surface(name)
 
         if not self._lines:
+            self.view.set_cull_boxes({})
             self._no_data_label.show()
             return
 
         self._no_data_label.hide()
 
-        amp_global_min, amp_global_max = _global_amplitude_bounds(self._lines)
-        colormap = pg.colormap.get("CET-L9")
+        amp_global_min, amp_global_max = _global_amplitude_bounds(
+            self._amplitude_range(line)
+            for line in self._lines.values()
+            if line.samples.size
+        )
 
         bounds = []
-        for line in self._lines.values():
-            surface = _build_surface_for_line(line, amp_global_min, amp_global_max, colormap)
-            if surface is None:
-                continue
-            self.view.addItem(surface)
-            self._surface_items.append(surface)
-            bounds.append((line.x.min(), line.x.max(), line.y.min(), line.y.max(), line.times_ms.max()))
+        drawn = []
+        for name, line in self._lines.items():
+            source = (line, amp_global_min, amp_global_max)
+            previous = self._surface_sources.get(name)
+            if previous is None or previous[0] is not line:
+                steps = _surface_steps(line)
+                if steps is None:
+                    self._remove_surface(name)
+                    continue
+                colors = self._surface_colors(line, steps, amp_global_min, amp_global_max)
+                mesh = _build_mesh_for_line(line, *steps, colors)
+                item = self._surface_items.get(name)
+                if item is None:
+                    item = gl.GLMeshItem(meshdata=mesh, shader="shaded", smooth=False)
+                    item.setGLOptions("translucent")
+                    self.view.addItem(item)
+                    self._surface_items[name] = item
+                else:
+                    item.setMeshData(meshdata=mesh)
+                self._surface_sources[name] = source
+            elif previous[1:] != source[1:]:
+                # Same geometry, new amplitude bounds: swap only the colours in
+                # the existing MeshData. Positions, faces and normals stay
+                # cached, and equal-sized VBOs are rewritten in place.
+                colors = self._surface_colors(
+                    line, _surface_steps(line), amp_global_min, amp_global_max
+                )
+                item = self._surface_items[name]
+                item.opts["meshdata"].setVertexColors(colors.reshape(-1, 4))
+                item.meshDataChanged()
+                self._surface_sources[name] = source
+            drawn.append(self._surface_items[name])
+            bounds.append((*line.bbox_xy, line.times_ms.min(), line.times_ms.max()))
+
+        self._prune_color_cache((amp_global_min, amp_global_max))
+
+        boxes = np.array(bounds).reshape(-1, 6)
+        # Curtains hang below z = 0 (z is -time).
+        self.view.set_cull_boxes({
+            item: ((b[0], b[2], -b[5]), (b[1], b[3], -b[4]))
+            for item, b in zip(drawn, boxes)
+        })
 
         if bounds:
-            xmin = min(b[0] for b in bounds)
-            xmax = max(b[1] for b in bounds)
-            ymin = min(b[2] for b in bounds)
-            ymax = max(b[3] for b in bounds)
-            zmax = max(b[4] for b in bounds)
+            xmin, ymin = boxes[:, [0, 2]].min(axis=0)
+            xmax, ymax, zmax = boxes[:, [1, 3, 5]].max(axis=0)
             span = max(xmax - xmin, ymax - ymin, zmax)
             self.view.opts["distance"] = span * 1.5 if span > 0 else 1000
 
+    def _remove_surface(self, name: str):
+        item = self._surface_items.pop(name, None)
+        self._surface_sources.pop(name, None)
+        if item is not None:
+            self.view.removeItem(item)
 
-def _global_amplitude_bounds(lines: Dict[str, SegyLine]) -> tuple[float, float]:
-    mins = []
-    maxs = []
-    for line in lines.values():
-        amin, amax = line.amplitude_range()
-        mins.append(amin)
-        maxs.append(amax)
-    return (min(mins), max(maxs)) if mins and maxs else (0.0, 1.0)
+    def _surface_colors(
+        self, line: SegyLine, steps: tuple[int, int], gmin: float, gmax: float
+    ) -> np.ndarray:
+        key = (id(line.samples), gmin, gmax)
+        cached = self._color_cache.get(key)
+        if cached is not None and cached[0] is line.samples:
+            return cached[1]
+        colors = _surface_colors(line, *steps, gmin, gmax, self._lut)
+        self._color_cache[key] = (line.samples, colors)
+        return colors
 
+    def _prune_color_cache(self, bounds: tuple[float, float]):
+        keep = {bounds, self._color_bounds}
+        live = {id(line.samples) for line in self._lines.values()}
+        self._color_cache = {
+            key: entry
+            for key, entry in self._color_cache.items()
+            if key[0] in live and key[1:] in keep
+        }
+        self._color_bounds = bounds
+
+    def _amplitude_range(self, line: SegyLine) -> tuple[float, float]:
+        cached = self._amp_cache.get(id(line))
+        if cached is not None and cached[0] is line:
+            return cached[1]
+        amp_range = line.amplitude_range()
+        self._amp_cache[id(line)] = (line, amp_range)
+        return amp_range
+
+
+# Upper bound on the (traces, samples) vertex grid of one 3D curtain.
+_MAX_SURFACE_TRACES = 200
+_MAX_SURFACE_SAMPLES = 300
+
+
+def _global_amplitude_bounds(ranges: Iterable[tuple[float, float]]) -> tuple[float, float]:
+    ranges = list(ranges)
+    if not ranges:
+        return 0.0, 1.0
+    mins, maxs = zip(*ranges)
+    return min(mins), max(maxs)
+
+
+def _surface_steps(line: SegyLine) -> tuple[int, int] | None:
+    """Return the ``(trace, sample)`` strides for a line's curtain, or None."""
 
-def _build_surface_for_line(
-    line: SegyLine,
-    global_min: float,
-    global_max: float,
-    colormap: pg.ColorMap,
-) -> gl.GLSurfacePlotItem | None:
     if line.samples.size == 0:
         return None
+    n_traces, n_samples = line.samples.shape
+    # Ceiling division keeps every curtain within the vertex budget.
+    trace_step = max(1, -(-n_traces // _MAX_SURFACE_TRACES))
+    sample_step = max(1, -(-n_samples // _MAX_SURFACE_SAMPLES))
+    if -(-n_traces // trace_step) < 2 or -(-n_samples // sample_step) < 2:
+        return None
+    return trace_step, sample_step
 
-    trace_step = max(1, line.samples.shape[0] // 200)
-    sample_step = max(1, line.samples.shape[1] // 300)
 
-    data = line.samples[::trace_step, ::sample_step]
+def _build_mesh_for_line(
+    line: SegyLine, trace_step: int, sample_step: int, colors: np.ndarray
+) -> gl.MeshData:
     x = line.x[::trace_step]
     y = line.y[::trace_step]
     times = line.times_ms[::sample_step]
 
-    if data.size == 0 or x.size == 0 or y.size == 0 or times.size == 0:
-        return None
+    # A line is a vertical curtain: vertex (i, j) sits at trace i, time j.
+    # Broadcasting fills the packed vertex buffer without building grids.
+    vertexes = np.empty((x.size, times.size, 3), dtype=np.float32)
+    vertexes[..., 0] = x[:, None]
+    vertexes[..., 1] = y[:, None]
+    vertexes[..., 2] = -times[None, :]
+
+    return gl.MeshData(
+        vertexes=vertexes.reshape(-1, 3),
+        faces=_grid_faces(x.size, times.size),
+        vertexColors=colors.reshape(-1, 4),
+    )
 
-    x_grid = np.repeat(x[:, None], times.size, axis=1)
-    y_grid = np.repeat(y[:, None], times.size, axis=1)
-    z_grid = -np.repeat(times[None, :], x.size, axis=0)
 
-    normalized = np.clip((data - global_min) / (global_max - global_min + 1e-6), 0, 1)
-    colors = colormap.map(normalized, mode="float")
+def _surface_colors(
+    line: SegyLine,
+    trace_step: int,
+    sample_step: int,
+    global_min: float,
+    global_max: float,
+    lut: np.ndarray,
+) -> np.ndarray:
+    """Return ``(traces, samples, 4)`` uint8 RGBA for the subsampled line."""
 
-    surface = gl.GLSurfacePlotItem(
-        x=x_grid,
-        y=y_grid,
-        z=z_grid,
-        colors=colors,
-        shader="shaded",
-        smooth=False,
-    )
-    surface.setGLOptions("translucent")
-    return surface
+    inv_range = 1.0 / (global_max - global_min + 1e-6)
+    data = line.samples[::trace_step, ::sample_step]
+    # One float32 buffer, rescaled in place to LUT indices (amp_scale undoes
+    # quantization); NaN maps to entry 0.
+    index = np.multiply(data, np.float32(line.meta.amp_scale), dtype=np.float32)
+    index -= np.float32(global_min)
+    index *= np.float32(255.0 * inv_range)
+    np.clip(index, 0, 255, out=index)
+    np.nan_to_num(index, copy=False, nan=0.0)
+    # uint8 RGBA is uploaded as normalised GL_UNSIGNED_BYTE (pyqtgraph >= 0.14).
+    return lut[index.astype(np.uint8)]
+
+
+@lru_cache(maxsize=8)
+def _grid_faces(n_rows: int, n_cols: int) -> np.ndarray:
+    """Return the triangle indices covering an ``n_rows x n_cols`` vertex grid."""
+
+    index = np.arange(n_rows * n_cols, dtype=np.uint32).reshape(n_rows, n_cols)
+    a = index[:-1, :-1]
+    b = index[1:, :-1]
+    c = index[:-1, 1:]
+    d = index[1:, 1:]
+    faces = np.stack([a, b, d, a, d, c], axis=-1).reshape(-1, 3)
+    faces.setflags(write=False)
+    return faces